@@ -1,5 +1,7 @@
 """Configuration settings for the hpath-sim app."""
 
+import os
+
 REDIS_HOST = 'redis'
 """Hostname for the Redis server."""
 
@@ -10,6 +12,14 @@ REDIS_PORT = 6379
 PORT = 5000
 """Port to host this server on (internal port)."""
 
+MAX_CONTENT_LENGTH = 256 * 1024 * 1024
+"""Maximum size (in bytes) of a request body, e.g. a submission of base64-encoded Excel
+files.  Larger requests are rejected with HTTP status 413."""
+
+DEBUG = os.environ.get('HPATH_DEBUG', '') == '1'
+"""If true, run the Flask development server in debug mode.  Set the environment variable
+``HPATH_DEBUG=1`` to enable.  Has no effect when serving with gunicorn."""
+
 DB_PATH = "/db/hpath.db"
 """Path to the simulation job store, a SQLite database."""
 
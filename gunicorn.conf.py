@@ -0,0 +1,25 @@
+"""Gunicorn configuration for the hpath-sim REST server.
+
+Usage (from this directory): ``gunicorn hpath_backend.server.restful:app``
+"""
+import multiprocessing
+
+from conf import PORT
+from hpath_backend import db
+
+bind = f'0.0.0.0:{PORT}'
+"""Address to serve on."""
+
+worker_class = 'gthread'
+"""Use threaded workers, so that slow requests (e.g. large uploads) do not block others."""
+
+workers = multiprocessing.cpu_count()
+"""Number of worker processes."""
+
+threads = 8
+"""Number of threads per worker process."""
+
+
+def on_starting(server):  # pylint: disable=unused-argument
+    """Initialise the database once, in the master process, before forking any workers."""
+    db.init()
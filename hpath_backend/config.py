@@ -5,6 +5,7 @@ To actually run a simulation, the configuration settings (as a :py:class:`hpath.
 object) are converted to a :py:class:`hpath.model.Model` object, which contain the actual Python
 objects used for :py:class:`~salabim.Resource` tracking, etc.
 """
+import functools
 import typing as ty
 
 import networkx as nx
@@ -555,6 +556,33 @@ class Globals(pyd.BaseModel):
     num_slides_serials: IntDistributionInfo = pyd.Field(title='NumSlidesLarges')
     """Parameters for the number of slides produced for a serials microtomy task."""
 
+    @functools.cached_property
+    def cutup_probs(self) -> tuple[float, float]:
+        """Cumulative probabilities ``(BMS, BMS + Pool)`` of the cut-up type for a non-urgent
+        specimen. With the remaining probability, a specimen goes to large specimens cut-up."""
+        return (self.prob_bms_cutup, self.prob_bms_cutup + self.prob_pool_cutup)
+
+    @functools.cached_property
+    def cutup_probs_urgent(self) -> tuple[float, float]:
+        """Cumulative probabilities ``(BMS, BMS + Pool)`` of the cut-up type for an urgent
+        specimen. With the remaining probability, a specimen goes to large specimens cut-up."""
+        return (self.prob_bms_cutup_urgent,
+                self.prob_bms_cutup_urgent + self.prob_pool_cutup_urgent)
+
+    @functools.cached_property
+    def invest_probs_internal(self) -> tuple[float, float]:
+        """Cumulative probabilities ``(easy, easy + hard)`` of the additional booking-in
+        investigation for an internal specimen. With the remaining probability, no
+        investigation is required."""
+        return (self.prob_invest_easy, self.prob_invest_easy + self.prob_invest_hard)
+
+    @functools.cached_property
+    def decalc_probs(self) -> tuple[float, float]:
+        """Cumulative probabilities ``(bone station, bone station + decalc oven)`` of the
+        decalcification type for a specimen. With the remaining probability, no decalcification
+        is required."""
+        return (self.prob_decalc_bone, self.prob_decalc_bone + self.prob_decalc_oven)
+
 
 class MockCounts(pyd.BaseModel):
     """Stores the initial number of mock specimens for the simulation model when
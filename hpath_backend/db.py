@@ -2,9 +2,12 @@
 backend."""
 import os
 import sqlite3 as sql
-from datetime import datetime
+import threading
+from contextlib import closing
+from time import time
+from typing import Any, Callable
 
-import pandas as pd
+import zstandard
 
 from conf import DB_PATH, DB_PERSISTENCE
 from .types import HPathConfigParams, HPathSharedParams
@@ -15,8 +18,8 @@ SQL_PERSIST = " IF NOT EXISTS" if DB_PERSISTENCE else ""
 
 SQL_INIT = f"""\
 BEGIN TRANSACTION;
-{"DROP TABLE IF EXISTS analyses;" if not DB_PERSISTENCE else ""}
 {"DROP TABLE IF EXISTS scenarios;" if not DB_PERSISTENCE else ""}
+{"DROP TABLE IF EXISTS analyses;" if not DB_PERSISTENCE else ""}
 CREATE TABLE{SQL_PERSIST} "analyses" (
         "analysis_id"    INTEGER,
         "analysis_name"  TEXT NOT NULL,
@@ -30,16 +33,55 @@ CREATE TABLE{SQL_PERSIST} "scenarios" (
         "completed"     REAL,
         "num_reps"      INTEGER NOT NULL,
         "done_reps"     INTEGER NOT NULL DEFAULT 0,
-        "results"       TEXT,
+        "results"       BLOB,
         "file_name"     TEXT,
         "file"  BLOB,
+        "error"         TEXT,
         FOREIGN KEY("analysis_id") REFERENCES "analyses"("analysis_id"),
         PRIMARY KEY("scenario_id" AUTOINCREMENT)
 );
+CREATE INDEX IF NOT EXISTS "idx_scenarios_analysis_id" ON "scenarios"("analysis_id");
+CREATE INDEX IF NOT EXISTS "idx_scenarios_created" ON "scenarios"("created");
+DROP TABLE IF EXISTS configs;
+CREATE TABLE "configs" (
+        "file_hash"     BLOB NOT NULL,
+        "created"       REAL NOT NULL,
+        "config"        BLOB NOT NULL,
+        PRIMARY KEY("file_hash")
+) WITHOUT ROWID;
 DELETE FROM sqlite_sequence;
 COMMIT;
 """  # Generated from sqlitebrowser
-"""SQLite command for initialising the database."""
+"""SQLite command for initialising the database.  The ``configs`` table only caches parsed
+config files, so is always rebuilt in case the config format has changed."""
+
+SQL_ADD_ERROR_COLUMN = """\
+ALTER TABLE scenarios ADD COLUMN "error" TEXT
+"""
+"""SQLite command for adding the ``error`` column to a ``scenarios`` table created before the
+column was introduced."""
+
+SQL_PRAGMAS_INIT = """\
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
+PRAGMA cache_size=-65536;
+"""
+"""SQLite PRAGMAs applied when initialising the database.  ``journal_mode=WAL`` is
+persistent, so only needs to be set once per database file."""
+
+DB_PAGE_SIZE = 8192
+"""Page size (in bytes) for newly created databases.  Larger pages reduce the number of
+overflow pages needed to store the ``file`` BLOBs."""
+
+SQL_PRAGMAS_CONNECT = """\
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
+PRAGMA mmap_size=10737418240;
+PRAGMA cache_size=-65536;
+PRAGMA foreign_keys=ON;
+"""
+"""SQLite PRAGMAs applied to every new connection (these settings are not persistent)."""
 
 SQL_LIST_SCENARIOS = """\
 SELECT
@@ -51,9 +93,11 @@ SELECT
     completed,
     num_reps,
     done_reps,
-    file_name
+    file_name,
+    error
 FROM scenarios
 LEFT JOIN analyses ON scenarios.analysis_id = analyses.analysis_id
+ORDER BY created DESC, scenario_id DESC
 """
 """SQLite command for listing the scenarios."""
 
@@ -62,7 +106,8 @@ SELECT
     scenario_id,
     scenario_name,
     analysis_id,
-    results
+    results,
+    error
 FROM scenarios
 WHERE scenario_id = ?
 """
@@ -76,13 +121,40 @@ VALUES(?)
 
 SQL_INSERT_SCENARIO = """\
 INSERT INTO scenarios(scenario_name, analysis_id, created, num_reps, file_name, file)
-VALUES(?,?,?,?,?,?)
+VALUES(?,?,?,?,?,zeroblob(?))
 """
-"""SQLite command for creating a new simulation scenario."""
+"""SQLite command for creating a new simulation scenario.  The ``file`` column is allocated
+as a zero-filled BLOB of the given length and written using incremental BLOB I/O."""
+
+SQL_MAX_SCENARIO_ID = """\
+SELECT COALESCE(MAX(scenario_id), 0)
+FROM scenarios
+"""
+"""SQLite command for fetching the largest existing scenario ID."""
+
+SQL_NEW_SCENARIO_IDS = """\
+SELECT scenario_id
+FROM scenarios
+WHERE scenario_id > ? AND scenario_id <= last_insert_rowid()
+ORDER BY scenario_id
+"""
+"""SQLite command for fetching the IDs of scenarios inserted after a given scenario ID."""
+
+SQL_DELETE_SCENARIO = """\
+DELETE FROM scenarios
+WHERE scenario_id = ?
+"""
+"""SQLite command for deleting a scenario."""
+
+SQL_DELETE_ANALYSIS = """\
+DELETE FROM analyses
+WHERE analysis_id = ?
+"""
+"""SQLite command for deleting a multi-scenario analysis."""
 
 SQL_UPDATE_PROGRESS = """\
 UPDATE scenarios
-SET done_reps = num_reps
+SET done_reps = MIN(done_reps + 1, num_reps)
 WHERE scenario_id = ?
 """
 """SQLite command for incrementing the progress counter."""
@@ -96,55 +168,168 @@ WHERE scenario_id = ?
 """
 """SQLite command for saving simulation results to database."""
 
+SQL_LOAD_CONFIG = """\
+SELECT config
+FROM configs
+WHERE file_hash = ?
+"""
+"""SQLite command for fetching a cached parsed config."""
+
+SQL_SAVE_CONFIG = """\
+INSERT OR REPLACE INTO configs(file_hash, created, config)
+VALUES(?,?,?)
+"""
+"""SQLite command for caching a parsed config."""
+
+SQL_PRUNE_CONFIGS = """\
+DELETE FROM configs
+WHERE file_hash NOT IN (
+    SELECT file_hash FROM configs ORDER BY created DESC LIMIT ?
+)
+"""
+"""SQLite command for deleting all but the most recently cached parsed configs."""
+
+SQL_SAVE_ERROR = """\
+UPDATE scenarios
+SET
+    completed = ?,
+    error = ?
+WHERE scenario_id = ?
+"""
+"""SQLite command for saving the error message of a failed simulation job to database."""
+
 SQL_CLEAR = """\
 BEGIN TRANSACTION;
-DELETE FROM analyses;
+DELETE FROM configs;
 DELETE FROM scenarios;
+DELETE FROM analyses;
 DELETE FROM sqlite_sequence;
 COMMIT;
 """
-"""Clear all database tables."""
-
-
-def submit_scenario(
-    name: str,
-    analysis_id: int | None,
-    num_reps: int,
-    file_name: str, file: bytes,
-    *,
-    cur: sql.Cursor
-) -> int:
-    """Submit a scenario and return the new scenario ID."""
-    cur.execute(
-        SQL_INSERT_SCENARIO,
-        (
-            name,
-            analysis_id,
-            # Convert LOCAL time to UNIX time, WHICH IS ALWAYS UTC-BASED
-            datetime.now().timestamp(),
-            num_reps,
-            file_name,
-            file
-        )
-    )
-    scenario_id = cur.lastrowid
-    return scenario_id
+"""Clear all database tables.  Scenarios are deleted before the analyses they reference, as
+foreign key constraints are enforced."""
+
+
+DB_BUSY_TIMEOUT = 120
+"""Time (in seconds) to wait for a database lock held by another connection.  Writers may
+wait for the write lock while large submissions are being written, so this is set
+generously."""
+
+
+def _connect() -> sql.Connection:
+    """Open a new connection to the database at ``DB_PATH``.
+
+    The connection is opened in autocommit mode (``isolation_level=None``), so transactions
+    must be started explicitly using ``BEGIN``.
+    """
+    conn = sql.connect(DB_PATH, isolation_level=None, timeout=DB_BUSY_TIMEOUT,
+                       cached_statements=256)
+    conn.executescript(SQL_PRAGMAS_CONNECT)
+    return conn
+
+
+_WARM_STATEMENTS = (
+    (SQL_SCENARIO_RESULTS, (0, )),
+)
+"""Frequently-used statements and no-op parameters (scenario IDs start at 1), executed when a
+cached connection is created so that the prepared statements are already in the statement
+cache, which is keyed on the exact SQL text.  Only read-only statements are warmed, since
+executing a write statement (even one matching no rows) takes the database write lock."""
+
+BLOB_CHUNK_SIZE = 1 << 20
+"""Chunk size (in bytes) for incremental BLOB writes."""
+
+_local = threading.local()
+"""Thread-local storage for cached database connections."""
+
+CONFIG_CACHE_SIZE = 64
+"""Maximum number of parsed configs held in the ``configs`` table."""
+
+
+def _get_conn() -> sql.Connection:
+    """Return this thread's cached connection to the database, creating it if needed.
+
+    The connection is kept open between calls so that SQLite's page cache and prepared
+    statement cache persist.  A new connection is created if the process has been forked
+    since the cached connection was opened (e.g. in an RQ work horse).
+    """
+    if getattr(_local, 'pid', None) != os.getpid():
+        conn = _connect()
+        for query, params in _WARM_STATEMENTS:
+            conn.execute(query, params)
+        _local.conn = conn
+        _local.pid = os.getpid()
+    return _local.conn
+
+
+def _write_blob(conn: sql.Connection, table: str, column: str, row: int, data: bytes) -> None:
+    """Write ``data`` into a pre-allocated (zero-filled) BLOB using incremental I/O, avoiding
+    an extra copy of the payload through statement parameter binding."""
+    if not data:
+        return
+    view = memoryview(data)
+    with conn.blobopen(table, column, row, readonly=False) as blob:
+        for start in range(0, len(view), BLOB_CHUNK_SIZE):
+            blob.write(view[start:start+BLOB_CHUNK_SIZE])
+
+
+def _read_blob(conn: sql.Connection, table: str, column: str, row: int) -> bytes:
+    """Read a BLOB using incremental I/O."""
+    with conn.blobopen(table, column, row, readonly=True) as blob:
+        return blob.read()
+
+
+RESULTS_MAGIC = b'ZR1\0'
+"""Header identifying a zstd-compressed results JSON document.  Results saved before
+compression was introduced are stored as uncompressed JSON text."""
+
+RESULTS_ZSTD_LEVEL = 3
+"""zstd compression level for saved results."""
+
+
+def _pack_results(result_json: str | bytes) -> bytes:
+    """Compress a results JSON document for storage."""
+    if isinstance(result_json, str):
+        result_json = result_json.encode()
+    return RESULTS_MAGIC + zstandard.compress(result_json, RESULTS_ZSTD_LEVEL)
+
+
+def _unpack_results(results: bytes | str | None) -> str | None:
+    """Decompress a results JSON document packed using `_pack_results`."""
+    if isinstance(results, bytes) and results.startswith(RESULTS_MAGIC):
+        return zstandard.decompress(results[len(RESULTS_MAGIC):]).decode()
+    return results
+
+
+def _fetch_records(conn: sql.Connection, query: str, params: tuple = ()) -> list[dict]:
+    """Run a SELECT query and return the result set as a list of dicts, one per row."""
+    cur = conn.execute(query, params)
+    columns = [desc[0] for desc in cur.description]
+    return [dict(zip(columns, row)) for row in cur]
 
 
 def submit_scenarios(
     configs: list[HPathConfigParams],
-    params: HPathSharedParams
+    params: HPathSharedParams,
+    on_submit: Callable[[list[int]], Any] | None = None
 ) -> list[int]:
     """Submit a list of scenarios as a single transaction, i.e. failure will rollback the
     entire transaction.
 
+    If given, ``on_submit`` is called with the new scenario IDs once the transaction has been
+    committed, e.g. to enqueue simulation jobs.  If it raises, the new scenarios are deleted
+    and the exception is re-raised.  As scenario IDs are allocated using AUTOINCREMENT, the
+    IDs of deleted scenarios are not reused by later submissions.
+
     Connected to endpoint `submit/` on the REST server.
     """
-    with sql.connect(DB_PATH) as conn:
+    conn = _get_conn()
+    with conn:
         cur = conn.cursor()
-        scenario_ids: list[int] = []
 
         try:
+            cur.execute("BEGIN IMMEDIATE")
+
             # If multi-scenario analysis:
             if len(configs) > 1 and params.analysis_name is not None:
                 cur.execute(SQL_INSERT_ANALYSIS, (params.analysis_name, ))
@@ -152,21 +337,51 @@ def submit_scenarios(
             else:
                 analysis_id = None
 
-            for config in configs:
-                scenario_id = submit_scenario(
-                    config.name,
-                    analysis_id=analysis_id,
-                    num_reps=1,
-                    file_name=config.file_name,
-                    file=config.file,
-                    cur=cur
-                )
-                scenario_ids.append(scenario_id)
+            # UNIX time, WHICH IS ALWAYS UTC-BASED; shared by all scenarios in the submission
+            now = time()
+            rows = [
+                (config.name, analysis_id, now, 1, config.file_name, len(config.file))
+                for config in configs
+            ]
+
+            # BEGIN IMMEDIATE holds the write lock, so the new rows are allocated contiguous
+            # IDs greater than the current maximum
+            last_id = cur.execute(SQL_MAX_SCENARIO_ID).fetchone()[0]
+            cur.executemany(SQL_INSERT_SCENARIO, rows)
+            scenario_ids = [row[0] for row in cur.execute(SQL_NEW_SCENARIO_IDS, (last_id, ))]
+
+            for config, scenario_id in zip(configs, scenario_ids):
+                _write_blob(conn, 'scenarios', 'file', scenario_id, config.file)
 
             conn.commit()
-            return scenario_ids
+        except Exception as err:
+            if conn.in_transaction:
+                conn.rollback()
+            raise err
+
+    if on_submit is not None:
+        try:
+            on_submit(scenario_ids)
+        except Exception as err:
+            _delete_scenarios(scenario_ids, analysis_id)
+            raise err
+    return scenario_ids
+
+
+def _delete_scenarios(scenario_ids: list[int], analysis_id: int | None):
+    """Delete the given scenarios, and the given analysis if not ``None``, as a single
+    transaction."""
+    conn = _get_conn()
+    with conn:
+        cur = conn.cursor()
+        try:
+            cur.execute("BEGIN IMMEDIATE")
+            cur.executemany(SQL_DELETE_SCENARIO, [(scenario_id, ) for scenario_id in scenario_ids])
+            if analysis_id is not None:
+                cur.execute(SQL_DELETE_ANALYSIS, (analysis_id, ))
+            conn.commit()
         except sql.Error as err:
-            if conn.in_transaction():
+            if conn.in_transaction:
                 conn.rollback()
             raise err
 
@@ -174,61 +389,144 @@ def submit_scenarios(
 def update_progress(scenario_id: int):
     """Increment the done_reps counter for the scenario with the given ID."""
     try:
-        with sql.connect(DB_PATH) as conn:
+        conn = _get_conn()
+        with conn:
             cur = conn.cursor()
             cur.execute(SQL_UPDATE_PROGRESS, (scenario_id, ))
     except sql.Error as err:
         raise err
 
 
-def save_result(scenario_id: int, result_json: str):
-    """Save the results JSON to database for the scenario with the given ID."""
-    try:
-        with sql.connect(DB_PATH) as conn:
-            cur = conn.cursor()
+def save_result(scenario_id: int, result_json: str | bytes, increment_progress: bool = False):
+    """Save the results JSON to database for the scenario with the given ID.  The results are
+    stored compressed.
+
+    If ``increment_progress`` is true, the done_reps counter is also incremented in the same
+    transaction.
+    """
+    conn = _get_conn()
+    with conn:
+        cur = conn.cursor()
+        try:
+            cur.execute("BEGIN IMMEDIATE")
+            if increment_progress:
+                cur.execute(SQL_UPDATE_PROGRESS, (scenario_id, ))
             cur.execute(
                 SQL_SAVE_RESULT,
                 (
-                    datetime.now().timestamp(),  # SET completed = ?
-                    result_json,  # results = ?
+                    time(),  # SET completed = ?
+                    _pack_results(result_json),  # results = ?
                     scenario_id   # WHERE scenario_id = ?
                 )
             )
-    except sql.Error as err:
-        raise err
+            conn.commit()
+        except sql.Error as err:
+            if conn.in_transaction:
+                conn.rollback()
+            raise err
 
 
-def list_scenarios() -> pd.DataFrame:
-    """Get the list of scenarios and convert to a dict for input to a Dash AG Grid.
+def save_error(scenario_id: int, message: str):
+    """Mark the scenario with the given ID as completed with an error, e.g. if its config file
+    could not be parsed.  The message is returned in the ``error`` field of the scenario."""
+    conn = _get_conn()
+    with conn:
+        cur = conn.cursor()
+        try:
+            cur.execute("BEGIN IMMEDIATE")
+            cur.execute(SQL_SAVE_ERROR, (time(), message, scenario_id))
+            conn.commit()
+        except sql.Error as err:
+            if conn.in_transaction:
+                conn.rollback()
+            raise err
+
+
+def list_scenarios() -> list[dict]:
+    """Get the list of scenarios as a list of dicts for input to a Dash AG Grid.
 
     Connected to endpoint `scenarios/` on the REST server.
     """
     try:
-        with sql.connect(DB_PATH) as conn:
-            df = pd.read_sql(SQL_LIST_SCENARIOS, conn)
-            return df
+        conn = _get_conn()
+        with conn:
+            return _fetch_records(conn, SQL_LIST_SCENARIOS)
+    except sql.Error as err:
+        raise err
+
+
+def results_scenario(scenario_id: int) -> list[dict]:
+    """Return the results of a scenario task, as a list containing zero or one dicts."""
+    try:
+        conn = _get_conn()
+        with conn:
+            cur = conn.execute(SQL_SCENARIO_RESULTS, (scenario_id, ))
+            columns = [desc[0] for desc in cur.description]
+            results_idx = columns.index('results')
+            rows = [
+                row[:results_idx] + (_unpack_results(row[results_idx]), ) + row[results_idx+1:]
+                for row in cur
+            ]
+    except sql.Error as err:
+        raise err
+    return [dict(zip(columns, row)) for row in rows]
+
+
+def load_file(scenario_id: int) -> bytes:
+    """Return the config file submitted for the scenario with the given ID."""
+    try:
+        conn = _get_conn()
+        with conn:
+            return _read_blob(conn, 'scenarios', 'file', scenario_id)
     except sql.Error as err:
         raise err
 
 
-def results_scenario(scenario_id: int) -> pd.DataFrame:
-    """Return the results of a scenario task."""
+def load_config(file_hash: bytes) -> bytes | None:
+    """Return the cached parsed config (as JSON) for the config file with the given hash, or
+    ``None`` if not cached."""
     try:
-        with sql.connect(DB_PATH) as conn:
-            df = pd.read_sql(SQL_SCENARIO_RESULTS, conn, params=(scenario_id, ))
-            return df
+        conn = _get_conn()
+        with conn:
+            row = conn.execute(SQL_LOAD_CONFIG, (file_hash, )).fetchone()
+            return None if row is None else row[0]
     except sql.Error as err:
         raise err
 
 
+def save_config(file_hash: bytes, config_json: str | bytes):
+    """Cache a parsed config (as JSON) for the config file with the given hash, keeping only
+    the `CONFIG_CACHE_SIZE` most recently cached configs."""
+    if isinstance(config_json, str):
+        config_json = config_json.encode()
+    conn = _get_conn()
+    with conn:
+        cur = conn.cursor()
+        try:
+            cur.execute("BEGIN IMMEDIATE")
+            cur.execute(SQL_SAVE_CONFIG, (file_hash, time(), config_json))
+            cur.execute(SQL_PRUNE_CONFIGS, (CONFIG_CACHE_SIZE, ))
+            conn.commit()
+        except sql.Error as err:
+            if conn.in_transaction:
+                conn.rollback()
+            raise err
+
+
 def init():
     """Initialise the database, adding the required tables if missing."""
     try:
         os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
-        with sql.connect(DB_PATH) as conn:
+        with closing(_connect()) as conn:
             cur = conn.cursor()
+            # The page size can only be changed before the first table is created
+            if cur.execute("PRAGMA page_count").fetchone()[0] == 0:
+                cur.execute(f"PRAGMA page_size={DB_PAGE_SIZE}")
             cur.executescript(SQL_INIT)
-            conn.commit()
+            columns = [row[1] for row in cur.execute("PRAGMA table_info(scenarios)")]
+            if 'error' not in columns:
+                cur.execute(SQL_ADD_ERROR_COLUMN)
+            cur.executescript(SQL_PRAGMAS_INIT)
     except sql.Error as err:
         raise err
 
@@ -236,9 +534,8 @@ def clear():
     """Clear all database tables."""
     try:
         os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
-        with sql.connect(DB_PATH) as conn:
+        with closing(_connect()) as conn:
             cur = conn.cursor()
             cur.executescript(SQL_CLEAR)
-            conn.commit()
     except sql.Error as err:
         raise err
@@ -4,14 +4,26 @@ This module overrides the :py:class:`~salabim.Constant` and
 :py:class:`~salabim.Triangular` classes in :py:mod:`salabim`
 to provide better string representations, and adds a PERT distribution.
 
+All distributions in this module can also be sampled in bulk by calling them with a ``size``
+argument, e.g. ``dist(size=100)``, which returns a NumPy array of independent samples drawn
+using a :py:class:`numpy.random.Generator`.
+
 See: https://en.wikipedia.org/wiki/PERT_distribution
 """
 
+import random
 from typing import Union
 
+import numpy as np
 import salabim as sim
 
 
+def _default_rng(randomstream) -> np.random.Generator:
+    """Return a NumPy random generator seeded from a salabim randomstream, so that results are
+    reproducible whenever the salabim random seed is fixed."""
+    return np.random.default_rng((randomstream or random).getrandbits(64))
+
+
 class Constant(sim.Constant):
     """Constant distribution.
 
@@ -22,6 +34,12 @@ class Constant(sim.Constant):
     def __repr__(self) -> str:
         return f'Constant({self._value}, time_unit={self.time_unit})'
 
+    def __call__(self, size: int | None = None) -> float | np.ndarray:
+        """Return a single sample, or an array of ``size`` samples."""
+        if size is None:
+            return self.sample()
+        return np.full(size, self._mean, dtype=np.float64)
+
 
 class Tri(sim.Triangular):
     """Triangular distribution.
@@ -44,15 +62,26 @@ class Tri(sim.Triangular):
             high: float | None = None,
             time_unit: str | None = None,
             randomstream=None,
-            env: sim.Environment | None = None
+            env: sim.Environment | None = None,
+            rng: np.random.Generator | None = None
     ) -> None:
         # Reorder low,high,mode parameters
         super().__init__(low, high, mode, time_unit, randomstream, env)
+        self.rng = rng or _default_rng(randomstream)
 
     def __repr__(self) -> str:
         return f"Triangular(low={self._low}, mode={self._mode}, high={self._high}, "\
                f"time_unit={self.time_unit})"
 
+    def __call__(self, size: int | None = None) -> float | np.ndarray:
+        """Return a single sample, or an array of ``size`` samples."""
+        if size is None:
+            return self.sample()
+        if self._high == self._low:  # numpy requires left < right
+            return np.full(size, self._low * self.time_unit_factor, dtype=np.float64)
+        return self.rng.triangular(self._low, self._mode, self._high, size)\
+            * self.time_unit_factor
+
 
 class PERT(sim.Triangular):
     """PERT distribution.
@@ -81,8 +110,10 @@ class PERT(sim.Triangular):
         time_unit: str | None = None,
         randomstream=None,
         env: sim.Environment | None = None,
+        rng: np.random.Generator | None = None
     ) -> None:
         super().__init__(low, high, mode, time_unit, randomstream, env)
+        self.rng = rng or _default_rng(randomstream)
         self._shape = 4
 
         self._range = high - low
@@ -119,6 +150,13 @@ class PERT(sim.Triangular):
         """:meta private:"""
         return self._mean * self.time_unit_factor
 
+    def __call__(self, size: int | None = None) -> float | np.ndarray:
+        """Return a single sample, or an array of ``size`` samples."""
+        if size is None:
+            return self.sample()
+        val = self._low + self.rng.beta(self._alpha, self._beta, size) * self._range
+        return val * self.time_unit_factor
+
 
 Distribution = Union[Constant, Tri, PERT]
 
@@ -126,7 +164,8 @@ Distribution = Union[Constant, Tri, PERT]
 class IntPERT:
     """Discretized PERT distribution."""
 
-    def __init__(self, low: int, mode: int, high: int, env: sim.Environment):
+    def __init__(self, low: int, mode: int, high: int, env: sim.Environment,
+                 rng: np.random.Generator | None = None):
         self.low = low
         """Minimum of the distribution."""
 
@@ -136,7 +175,7 @@ class IntPERT:
         self.high = high
         """Maximum of the distribution."""
 
-        self.pert = PERT(low-mode-0.5, 0, high-mode+0.5, env=env)
+        self.pert = PERT(low-mode-0.5, 0, high-mode+0.5, env=env, rng=rng)
         """Underlying continuous PERT distribution, i.e.
         ``PERT(low-mode-0.5, 0, high-mode+0.5)``."""
 
@@ -144,9 +183,11 @@ class IntPERT:
         """Sample the distribution."""
         return self()
 
-    def __call__(self) -> int:
+    def __call__(self, size: int | None = None) -> int | np.ndarray:
         # Round towards 0 and add the mode
-        return int(self.pert.sample()) + self.mode
+        if size is None:
+            return int(self.pert.sample()) + self.mode
+        return self.pert(size=size).astype(np.int64) + self.mode
 
     def __repr__(self) -> str:
         return f'IntPERT({self.low}, {self.mode}, {self.high})'
@@ -10,352 +10,477 @@ however, mock specimens should be excluded from computing average delay
 statistics.
 """
 
-from typing import Callable, Self, TYPE_CHECKING
+import dataclasses
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Sequence
+
+import numpy as np
+
 from hpath_backend.specimens import Priority, Specimen, Block, Slide
 
 if TYPE_CHECKING:
+    from hpath_backend.distributions import Distribution, IntPERT
     from hpath_backend.model import Model
 
+STAGES = ('reception', 'cutup', 'processing', 'microtomy', 'staining',
+          'labelling', 'scanning', 'qc', 'reporting')
+"""Stages of the histopathology process, in order."""
+
+INSERT_POINTS = ('arrive_reception', 'cutup_start', 'processing_start', 'microtomy',
+                 'staining_start', 'labelling', 'scanning_start', 'qc', 'assign_histopath')
+"""Process at which a mock specimen waiting in the corresponding entry of `STAGES` is
+inserted into the simulation model."""
+
+_INSERT_IDXS = {insert_point: idx for idx, insert_point in enumerate(INSERT_POINTS)}
+"""Index of each insert point in `INSERT_POINTS`."""
+
+TIMESTAMP_SCHEDULE = (
+    ('qc', None, 'qc_start', 'qc_end'),
+    ('scanning', 'scanning_to_qc', 'scanning_start', 'scanning_end'),
+    ('labelling', 'labelling_to_scanning', 'labelling_start', 'labelling_end'),
+    ('staining', 'staining_to_labelling', 'staining_start', 'staining_end'),
+    ('microtomy', 'microtomy_to_staining', 'microtomy_start', 'microtomy_end'),
+    ('processing', 'processing_to_microtomy', 'processing_start', 'processing_end'),
+    ('cutup', 'cutup_to_processing', 'cutup_start', 'cutup_end'),
+    ('reception', 'reception_to_cutup', 'reception_start', 'reception_end'),
+)
+"""Bootstrap stages in reverse order, as tuples of the form
+``(stage, transition to next stage, start timestamp key, end timestamp key)``."""
+
+_TIMESTAMP_DELTA_KEYS = tuple(
+    key for stage, transition, _, _ in TIMESTAMP_SCHEDULE for key in (transition, stage)
+)
+
+_TIMESTAMP_KEYS = tuple(
+    key for _, _, start_key, end_key in TIMESTAMP_SCHEDULE for key in (end_key, start_key)
+)
+
+
+@dataclass(kw_only=True, eq=False)
+class BootstrapArrays:
+    """Struct-of-arrays storage for the bootstrap durations of a cohort of mock specimens.
+
+    Entry ``i`` of each array belongs to the mock specimen with ``bootstrap_idx == i``.
+    Durations of stages not completed by a specimen are zero. Single precision is ample for
+    sampled task durations and halves the memory traffic of `InitSpecimen.compute_timestamps`.
+    """
+    reception: np.ndarray
+    reception_to_cutup: np.ndarray
+    cutup: np.ndarray
+    cutup_to_processing: np.ndarray
+    processing: np.ndarray
+    processing_to_microtomy: np.ndarray
+    microtomy: np.ndarray
+    microtomy_to_staining: np.ndarray
+    staining: np.ndarray
+    staining_to_labelling: np.ndarray
+    labelling: np.ndarray
+    labelling_to_scanning: np.ndarray
+    scanning: np.ndarray
+    scanning_to_qc: np.ndarray
+    qc: np.ndarray
+
+    @classmethod
+    def zeros(cls, n: int) -> 'BootstrapArrays':
+        """Create zero-filled arrays for a cohort of `n` mock specimens."""
+        return cls(**{field.name: np.zeros(n, dtype=np.float32)
+                     for field in dataclasses.fields(cls)})
+
+
+_CUTUP_OUTCOMES = (
+    ('BMS', 'small surgical'),
+    ('Pool', 'large surgical'),
+    ('Large specimens', 'large surgical'),
+    ('Large specimens', 'mega')
+)
+"""Cut-up type and block type for each cut-up outcome, indexed by the cut-up type index
+(see `InitSpecimen.init_cut_up`) plus one for a large specimens cut-up producing megas."""
+
+
+def _add_where(elapsed: np.ndarray, mask: np.ndarray, dist: 'Distribution') -> None:
+    """Add an independent sample of `dist` to each entry of `elapsed` selected by `mask`."""
+    k = np.count_nonzero(mask)
+    if k:
+        elapsed[mask] += dist(size=k)
+
+
+def _sample_where(out: np.ndarray, mask: np.ndarray, dist: 'Distribution | IntPERT') -> None:
+    """Overwrite each entry of `out` selected by `mask` with an independent sample of `dist`."""
+    k = np.count_nonzero(mask)
+    if k:
+        out[mask] = dist(size=k)
+
+
+def _rows(specimens: Sequence['InitSpecimen']) -> np.ndarray:
+    """Return the `BootstrapArrays` indices of a list of mock specimens."""
+    return np.array([spec.bootstrap_idx for spec in specimens], dtype=np.int64)
+
+
+def _sum_iid(counts: np.ndarray, dist: 'Distribution') -> np.ndarray:
+    """For each entry ``n`` of `counts`, return the sum of ``n`` independent samples of
+    `dist`."""
+    total = int(counts.sum())
+    if total == 0:
+        return np.zeros(len(counts))
+    owners = np.repeat(np.arange(len(counts)), counts)
+    return np.bincount(owners, weights=dist(size=total), minlength=len(counts))
+
 
 class InitSpecimen(Specimen):
-    """Special subclass of `Specimen` for specimens already in progress at simulation start."""
+    """Special subclass of `Specimen` for specimens already in progress at simulation start.
+
+    Task durations for mock specimens are generated in bulk, one stage at a time, for all mock
+    specimens that have already completed that stage (see `batch_bootstrap`)."""
+
+    # NOTE: to avoid name clashes with regular Specimen processes (which are added to the
+    # Specimen using setattr() in each of the `hpath_backend.process` submodules), we must
+    # use a "init_" prefix for the functions below.
+    #
+    # More specifically, each `hpath_backend.process` submodule calls Process.__init__(),
+    # which in turn calls Specimen.setattr().
 
-    def init_reception(self) -> None:
-        """Generate task_durations for specimen that has already completed Reception
+    @staticmethod
+    def init_reception(env: 'Model', specimens: Sequence['InitSpecimen'],
+                       arrays: BootstrapArrays) -> None:
+        """Generate task_durations for specimens that have already completed Reception
         at simulation start."""
-        env: 'Model' = self.env
+        n = len(specimens)
+        internal = np.array(
+            [env.specimen_data[spec.name()]['source'] == 'Internal' for spec in specimens],
+            dtype=bool
+        )
 
         # Receive and sort
-        elapsed_time = env.task_durations.receive_and_sort()
+        elapsed_time = env.task_durations.receive_and_sort(size=n)
 
         # Pre-booking-in investigation
-        if env.u01() < env.globals.prob_prebook:
-            elapsed_time += env.task_durations.pre_booking_in_investigation()
+        _add_where(elapsed_time, env.rng.random(n) < env.globals.prob_prebook,
+                   env.task_durations.pre_booking_in_investigation)
 
         # Booking-in
-        if env.specimen_data[self.name()]['source'] == 'Internal':
-            elapsed_time += env.task_durations.booking_in_internal()
-        else:
-            elapsed_time += env.task_durations.booking_in_external()
+        _add_where(elapsed_time, internal, env.task_durations.booking_in_internal)
+        _add_where(elapsed_time, ~internal, env.task_durations.booking_in_external)
 
         # Additional investigation
-        if env.specimen_data[self.name()]['source'] == 'Internal':
-            r = env.u01()
-            if r < env.globals.prob_invest_easy:
-                elapsed_time += env.task_durations.booking_in_investigation_internal_easy()
-            elif r < env.globals.prob_invest_easy + env.globals.prob_invest_hard:
-                elapsed_time += env.task_durations.booking_in_investigation_internal_hard()
-        elif env.u01() < env.globals.prob_invest_external:
-            elapsed_time += env.task_durations.booking_in_investigation_external()
+        r = env.rng.random(n)
+        prob_easy, prob_easy_or_hard = env.globals.invest_probs_internal
+        invest_easy = internal & (r < prob_easy)
+        invest_hard = internal & ~invest_easy & (r < prob_easy_or_hard)
+        invest_external = ~internal & (r < env.globals.prob_invest_external)
+        _add_where(elapsed_time, invest_easy,
+                   env.task_durations.booking_in_investigation_internal_easy)
+        _add_where(elapsed_time, invest_hard,
+                   env.task_durations.booking_in_investigation_internal_hard)
+        _add_where(elapsed_time, invest_external,
+                   env.task_durations.booking_in_investigation_external)
 
         # End of stage
-        env.specimen_data[self.name()]['bootstrap']['reception'] = elapsed_time
-        env.specimen_data[self.name()]['bootstrap']['reception_to_cutup']\
-            = env.processes['reception_to_cutup'].out_duration
-
-    def init_cut_up(self) -> None:
-        """Generate task_durations for specimen that has already completed Cut-Up
+        rows = _rows(specimens)
+        arrays.reception[rows] = elapsed_time
+        arrays.reception_to_cutup[rows] = env.processes['reception_to_cutup'].out_duration
+
+    @staticmethod
+    def init_cut_up(env: 'Model', specimens: Sequence['InitSpecimen'],
+                    arrays: BootstrapArrays) -> None:
+        """Generate task_durations for specimens that have already completed Cut-Up
         at simulation start."""
-        env: Model = self.env
-
-        r = env.u01()
-        suffix = '_urgent' if self.prio == Priority.URGENT else ''
-        if r < getattr(env.globals, 'prob_bms_cutup'+suffix):
-            env.specimen_data[self.name()]["cutup_type"] = 'BMS'
-
-            # One small surgical block
-            env.specimen_data[self.name()]['num_blocks'] = 1
-            self.blocks.append(Block(
-                f'{self.name()}.',
-                env=env,
-                parent=self,
-                block_type='small surgical'
-            ))
-            elapsed_time = env.task_durations.cut_up_bms()
-
-        elif r < (getattr(env.globals, 'prob_bms_cutup'+suffix) +
-                  getattr(env.globals, 'prob_pool_cutup'+suffix)):
-            env.specimen_data[self.name()]["cutup_type"] = 'Pool'
-
-            # One large surgical block
-            env.specimen_data[self.name()]['num_blocks'] = 1
-            self.blocks.append(Block(
-                f'{self.name()}.',
-                env=env,
-                parent=self,
-                block_type='large surgical'
-            ))
-            elapsed_time = env.task_durations.cut_up_pool()
-
-        else:
-            env.specimen_data[self.name()]["cutup_type"] = 'Large specimens'
-
-            # Urgent cut-ups never produce megas. Other large surgical blocks produce
-            # megas with a given probability.
-            if (self.prio == Priority.URGENT) or (env.u01() < env.globals.prob_mega_blocks):
-                n_blocks = env.globals.num_blocks_mega()
-                block_type = 'mega'
-            else:
-                n_blocks = env.globals.num_blocks_large_surgical()
-                block_type = 'large surgical'
-
-            env.specimen_data[self.name()]['num_blocks'] = n_blocks
-            for _ in range(n_blocks):
-                block = Block(
-                    f'{self.name()}.',
-                    env=env,
-                    parent=self,
-                    block_type=block_type
-                )
-                self.blocks.append(block)
-            elapsed_time = env.task_durations.cut_up_large_specimens()
+        n = len(specimens)
+        urgent = np.array([spec.prio == Priority.URGENT for spec in specimens], dtype=bool)
+
+        # Cut-up type index: 0 for BMS, 1 for Pool, 2 for Large specimens
+        r = env.rng.random(n)
+        cutup = np.where(urgent,
+                         np.searchsorted(env.globals.cutup_probs_urgent, r, side='right'),
+                         np.searchsorted(env.globals.cutup_probs, r, side='right'))
+        bms = cutup == 0
+        pool = cutup == 1
+        large = cutup == 2
+
+        # Urgent cut-ups never produce megas. Other large surgical blocks produce
+        # megas with a given probability.
+        megas = large & (urgent | (env.rng.random(n) < env.globals.prob_mega_blocks))
+        larges = large & ~megas
+
+        # BMS and Pool cut-ups produce one small surgical or large surgical block respectively
+        n_blocks = np.ones(n, dtype=np.int64)
+        _sample_where(n_blocks, megas, env.globals.num_blocks_mega)
+        _sample_where(n_blocks, larges, env.globals.num_blocks_large_surgical)
+
+        elapsed_time = np.zeros(n)
+        _add_where(elapsed_time, bms, env.task_durations.cut_up_bms)
+        _add_where(elapsed_time, pool, env.task_durations.cut_up_pool)
+        _add_where(elapsed_time, large, env.task_durations.cut_up_large_specimens)
+
+        for spec, outcome, num_blocks in zip(specimens, (cutup + megas).tolist(),
+                                             n_blocks.tolist()):
+            cutup_type, block_type = _CUTUP_OUTCOMES[outcome]
+            data = env.specimen_data[spec.name()]
+            data['cutup_type'] = cutup_type
+            data['num_blocks'] = num_blocks
+            spec.block_type = block_type
+            spec.blocks.extend(
+                Block.bulk_create(num_blocks, env=env, parent=spec, block_type=block_type)
+            )
 
         # End of stage
-        env.specimen_data[self.name()]['bootstrap']['cutup'] = elapsed_time
-        env.specimen_data[self.name()]['bootstrap']['cutup_to_processing'] = (
-            env.processes['cutup_bms_to_processing'].out_duration
-            if env.specimen_data[self.name()]["cutup_type"] == 'BMS'
-            else env.processes['cutup_pool_to_processing'].out_duration
-            if env.specimen_data[self.name()]["cutup_type"] == 'Pool'
-            else env.processes['cutup_large_to_processing'].out_duration
+        rows = _rows(specimens)
+        arrays.cutup[rows] = elapsed_time
+        arrays.cutup_to_processing[rows] = np.select(
+            [bms, pool],
+            [env.processes['cutup_bms_to_processing'].out_duration,
+             env.processes['cutup_pool_to_processing'].out_duration],
+            default=env.processes['cutup_large_to_processing'].out_duration
         )
 
-    # NOTE: to avoid name clashes with regular Specimen processes (which are added to the
-    # Specimen using setattr() in each of the `hpath_backend.process` submodules), we must
-    # use a "init_" prefix for the functions below.
-    #
-    # More specifically, each `hpath_backend.process` submodule calls Process.__init__(),
-    # which in turn calls Specimen.setattr().
-
-    def init_processing(self) -> None:
-        """Generate task_durations for specimen that has already completed Processing
+    @staticmethod
+    def init_processing(env: 'Model', specimens: Sequence['InitSpecimen'],
+                        arrays: BootstrapArrays) -> None:
+        """Generate task_durations for specimens that have already completed Processing
         at simulation start."""
-        env: Model = self.env
-        elapsed_time = 0
+        n = len(specimens)
+        elapsed_time = np.zeros(n)
 
         # Decalc
-        r = env.u01()
-        if r < env.globals.prob_decalc_bone:
-            env.specimen_data[self.name()]['decalc_type'] = 'bone station'
-            elapsed_time += (  # Assume no delay; all blocks decalc'ed simultaneously
-                env.task_durations.load_bone_station()
-                + env.task_durations.decalc()
-                + env.task_durations.unload_bone_station()
-            )
-        elif r < env.globals.prob_decalc_bone + env.globals.prob_decalc_oven:
-            env.specimen_data[self.name()]['decalc_type'] = 'decalc oven'
-            elapsed_time += (  # Assume no delay; all blocks decalc'ed simultaneously
-                env.task_durations.load_into_decalc_oven()
-                + env.task_durations.decalc()
-                + env.task_durations.unload_from_decalc_oven()
-            )
+        r = env.rng.random(n)
+        prob_bone, prob_bone_or_oven = env.globals.decalc_probs
+        bone = r < prob_bone
+        oven = ~bone & (r < prob_bone_or_oven)
+        # Assume no delay; all blocks decalc'ed simultaneously
+        _add_where(elapsed_time, bone, env.task_durations.load_bone_station)
+        _add_where(elapsed_time, bone | oven, env.task_durations.decalc)
+        _add_where(elapsed_time, bone, env.task_durations.unload_bone_station)
+        _add_where(elapsed_time, oven, env.task_durations.load_into_decalc_oven)
+        _add_where(elapsed_time, oven, env.task_durations.unload_from_decalc_oven)
 
         # Main processing
         # Assume no delay; all blocks processed simultaneously.
         # Take advantage of the fact all blocks will be of the same type.
-        elapsed_time += env.task_durations.load_processing_machine()
-        if self.prio == Priority.URGENT:
-            elapsed_time += env.task_durations.processing_urgent()
-        elif self.blocks[0].data["block_type"] == "small surgical":
-            elapsed_time += env.task_durations.processing_small_surgicals()
-        elif self.blocks[0].data["block_type"] == "large surgical":
-            elapsed_time += env.task_durations.processing_large_surgicals()
-        else:
-            elapsed_time += env.task_durations.processing_megas()
-        elapsed_time += env.task_durations.unload_processing_machine()
+        urgent = np.array([spec.prio == Priority.URGENT for spec in specimens], dtype=bool)
+        block_types = np.array([spec.block_type for spec in specimens])
+        small = ~urgent & (block_types == 'small surgical')
+        large = ~urgent & (block_types == 'large surgical')
+        megas = ~(urgent | small | large)
+        elapsed_time += env.task_durations.load_processing_machine(size=n)
+        _add_where(elapsed_time, urgent, env.task_durations.processing_urgent)
+        _add_where(elapsed_time, small, env.task_durations.processing_small_surgicals)
+        _add_where(elapsed_time, large, env.task_durations.processing_large_surgicals)
+        _add_where(elapsed_time, megas, env.task_durations.processing_megas)
+        elapsed_time += env.task_durations.unload_processing_machine(size=n)
+
+        for idx, spec in enumerate(specimens):
+            if bone[idx]:
+                env.specimen_data[spec.name()]['decalc_type'] = 'bone station'
+            elif oven[idx]:
+                env.specimen_data[spec.name()]['decalc_type'] = 'decalc oven'
 
         # End of stage
-        env.specimen_data[self.name()]['bootstrap']['processing'] = elapsed_time
-        env.specimen_data[self.name()]['bootstrap']['processing_to_microtomy'] \
-            = env.processes['processing_to_microtomy'].out_duration
-
-    def init_microtomy(self) -> None:
-        """Generate task_durations for specimen that has already completed Microtomy
+        rows = _rows(specimens)
+        arrays.processing[rows] = elapsed_time
+        arrays.processing_to_microtomy[rows] = \
+            env.processes['processing_to_microtomy'].out_duration
+
+    @staticmethod
+    def init_microtomy(env: 'Model', specimens: Sequence['InitSpecimen'],
+                       arrays: BootstrapArrays) -> None:
+        """Generate task_durations for specimens that have already completed Microtomy
         at simulation start."""
-        env: Model = self.env
+        n = len(specimens)
+
+        # Slides are microtomed manually, one block at a time
+        blocks = [block for spec in specimens for block in spec.blocks]
+        owners = np.repeat(np.arange(n), [len(spec.blocks) for spec in specimens])
+        m = len(blocks)
+
+        block_types = np.array([block.data['block_type'] for block in blocks])
+        small = block_types == 'small surgical'
+        large = block_types == 'large surgical'
+        # Small surgical blocks produce "levels" or "serials" slides
+        levels = small & (env.rng.random(m) < env.globals.prob_microtomy_levels)
+        serials = small & ~levels
+        megas = ~(small | large)
+
+        durations = np.zeros(m)
+        num_slides = np.zeros(m, dtype=np.int64)
+        for mask, duration, slides in (
+            (levels, env.task_durations.microtomy_levels, env.globals.num_slides_levels),
+            (serials, env.task_durations.microtomy_serials, env.globals.num_slides_serials),
+            (large, env.task_durations.microtomy_larges, env.globals.num_slides_larges),
+            (megas, env.task_durations.microtomy_megas, env.globals.num_slides_megas)
+        ):
+            _sample_where(durations, mask, duration)
+            _sample_where(num_slides, mask, slides)
+        slide_types = np.select([levels, serials, large], ['levels', 'serials', 'larges'],
+                                default='megas')
+
+        for block, slide_type, n_slides in zip(blocks, slide_types.tolist(), num_slides.tolist()):
+            block.slides.extend(
+                Slide.bulk_create(n_slides, env=env, parent=block, slide_type=slide_type)
+            )
+            block.data['num_slides'] = n_slides
 
-        # Take advantage of the fact all slides will be of the same type
-        # Slides are microtomed manually
         # Assume no gaps/delays, total elapsed time will be proportional to the number of blocks
-        elapsed_time = 0
-        env.specimen_data[self.name()]['total_slides'] = 0
-
-        for block in self.blocks:
-            if block.data['block_type'] == 'small surgical':
-                # Small surgical blocks produce "levels" or "serials" slides
-                if env.u01() < env.globals.prob_microtomy_levels:
-                    slide_type = 'levels'
-                    elapsed_time += env.task_durations.microtomy_levels()
-                    num_slides = env.globals.num_slides_levels()
-                else:
-                    slide_type = 'serials'
-                    elapsed_time += env.task_durations.microtomy_serials()
-                    num_slides = env.globals.num_slides_serials()
-            elif block.data['block_type'] == 'large surgical':
-                slide_type = 'larges'
-                elapsed_time += env.task_durations.microtomy_larges()
-                num_slides = env.globals.num_slides_larges()
-            else:
-                slide_type = 'megas'
-                elapsed_time += env.task_durations.microtomy_megas()
-                num_slides = env.globals.num_slides_megas()
-
-            for _ in range(num_slides):
-                slide = Slide(
-                    f'{block.name()}.',
-                    env=env,
-                    parent=block,
-                    slide_type=slide_type
-                )
-                block.slides.append(slide)
-            block.data['num_slides'] = num_slides
-            env.specimen_data[self.name()]['total_slides'] += num_slides
+        elapsed_time = np.bincount(owners, weights=durations, minlength=n)
+        total_slides = np.bincount(owners, weights=num_slides, minlength=n).astype(np.int64)
 
-        # End of stage
-        env.specimen_data[self.name()]['bootstrap']['microtomy'] = elapsed_time
-        env.specimen_data[self.name()]['bootstrap']['microtomy_to_staining'] \
-            = env.processes['microtomy_to_staining'].out_duration
+        for spec, n_slides in zip(specimens, total_slides.tolist()):
+            env.specimen_data[spec.name()]['total_slides'] = n_slides
 
-    def init_staining(self) -> None:
-        """Generate task_durations for specimen that has already completed Staining
+        # End of stage
+        rows = _rows(specimens)
+        arrays.microtomy[rows] = elapsed_time
+        arrays.microtomy_to_staining[rows] = env.processes['microtomy_to_staining'].out_duration
+
+    @staticmethod
+    def init_staining(env: 'Model', specimens: Sequence['InitSpecimen'],
+                      arrays: BootstrapArrays) -> None:
+        """Generate task_durations for specimens that have already completed Staining
         at simulation start."""
-        env: Model = self.env
+        n = len(specimens)
 
         # Take advantage of the fact all slides will be of the same type
+        # (mega blocks produce "megas" slides)
         # Assume all slides can be stained at the same time, with no delays
-        slides_type = self.blocks[0].slides[0].data['slide_type']
-        if slides_type == 'megas':
-            elapsed_time = env.task_durations.load_staining_machine_megas()
-            elapsed_time += env.task_durations.staining_megas()
-            elapsed_time += env.task_durations.unload_staining_machine_megas()
-            # mega slides are coverslipped individually
-            for block in self.blocks:
-                for _ in block.slides:
-                    elapsed_time += env.task_durations.coverslip_megas()
-        else:
-            elapsed_time = env.task_durations.load_staining_machine_regular()
-            elapsed_time += env.task_durations.staining_regular()
-            elapsed_time += env.task_durations.unload_staining_machine_regular()
-            elapsed_time += env.task_durations.load_coverslip_machine_regular()
-            elapsed_time += env.task_durations.coverslip_regular()
-            elapsed_time += env.task_durations.unload_coverslip_machine_regular()
+        megas = np.array([spec.block_type == 'mega' for spec in specimens], dtype=bool)
+        regular = ~megas
+        elapsed_time = np.zeros(n)
+        _add_where(elapsed_time, megas, env.task_durations.load_staining_machine_megas)
+        _add_where(elapsed_time, megas, env.task_durations.staining_megas)
+        _add_where(elapsed_time, megas, env.task_durations.unload_staining_machine_megas)
+        # mega slides are coverslipped individually
+        num_mega_slides = np.array(
+            [sum(len(block.slides) for block in spec.blocks) for spec in specimens],
+            dtype=np.int64
+        ) * megas
+        elapsed_time += _sum_iid(num_mega_slides, env.task_durations.coverslip_megas)
+
+        _add_where(elapsed_time, regular, env.task_durations.load_staining_machine_regular)
+        _add_where(elapsed_time, regular, env.task_durations.staining_regular)
+        _add_where(elapsed_time, regular, env.task_durations.unload_staining_machine_regular)
+        _add_where(elapsed_time, regular, env.task_durations.load_coverslip_machine_regular)
+        _add_where(elapsed_time, regular, env.task_durations.coverslip_regular)
+        _add_where(elapsed_time, regular, env.task_durations.unload_coverslip_machine_regular)
 
         # End of stage
-        env.specimen_data[self.name()]['bootstrap']['staining'] = elapsed_time
-        env.specimen_data[self.name()]['bootstrap']['staining_to_labelling'] \
-            = env.processes['staining_to_labelling'].out_duration
-
-    def init_labelling(self) -> None:
-        """Generate task_durations for specimen that has already completed Labelling
+        rows = _rows(specimens)
+        arrays.staining[rows] = elapsed_time
+        arrays.staining_to_labelling[rows] = env.processes['staining_to_labelling'].out_duration
+
+    @staticmethod
+    def init_labelling(env: 'Model', specimens: Sequence['InitSpecimen'],
+                       arrays: BootstrapArrays) -> None:
+        """Generate task_durations for specimens that have already completed Labelling
         at simulation start."""
-        env: Model = self.env
-
         # Slides are labelled individually
-        elapsed_time = 0
-        for block in self.blocks:
-            for _ in block.slides:
-                elapsed_time += env.task_durations.labelling()
+        num_slides = np.array(
+            [sum(len(block.slides) for block in spec.blocks) for spec in specimens],
+            dtype=np.int64
+        )
+        elapsed_time = _sum_iid(num_slides, env.task_durations.labelling)
 
         # End of stage
-        env.specimen_data[self.name()]['bootstrap']['labelling'] = elapsed_time
-        env.specimen_data[self.name()]['bootstrap']['labelling_to_scanning'] \
-            = env.processes['labelling_to_scanning'].out_duration
-
-    def init_scanning(self) -> None:
-        """Generate task_durations for specimen that has already completed Scanning
+        rows = _rows(specimens)
+        arrays.labelling[rows] = elapsed_time
+        arrays.labelling_to_scanning[rows] = env.processes['labelling_to_scanning'].out_duration
+
+    @staticmethod
+    def init_scanning(env: 'Model', specimens: Sequence['InitSpecimen'],
+                      arrays: BootstrapArrays) -> None:
+        """Generate task_durations for specimens that have already completed Scanning
         at simulation start."""
-        env: Model = self.env
+        n = len(specimens)
 
         # Assume all slides are scanned together
-        slides_type = self.blocks[0].slides[0].data['slide_type']
-        if slides_type == 'megas':
-            elapsed_time = env.task_durations.load_scanning_machine_megas()
-            elapsed_time += env.task_durations.scanning_megas()
-            elapsed_time += env.task_durations.unload_scanning_machine_megas()
-        else:
-            elapsed_time = env.task_durations.load_scanning_machine_regular()
-            elapsed_time += env.task_durations.scanning_regular()
-            elapsed_time += env.task_durations.unload_scanning_machine_regular()
+        megas = np.array([spec.block_type == 'mega' for spec in specimens], dtype=bool)
+        regular = ~megas
+        elapsed_time = np.zeros(n)
+        _add_where(elapsed_time, megas, env.task_durations.load_scanning_machine_megas)
+        _add_where(elapsed_time, megas, env.task_durations.scanning_megas)
+        _add_where(elapsed_time, megas, env.task_durations.unload_scanning_machine_megas)
+        _add_where(elapsed_time, regular, env.task_durations.load_scanning_machine_regular)
+        _add_where(elapsed_time, regular, env.task_durations.scanning_regular)
+        _add_where(elapsed_time, regular, env.task_durations.unload_scanning_machine_regular)
 
         # End of stage
-        env.specimen_data[self.name()]['bootstrap']['scanning'] = elapsed_time
-        env.specimen_data[self.name()]['bootstrap']['scanning_to_qc'] \
-            = env.processes['scanning_to_qc'].out_duration
-
-    def init_qc(self) -> None:
-        """Generate task_durations for specimen that has already completed QC
+        rows = _rows(specimens)
+        arrays.scanning[rows] = elapsed_time
+        arrays.scanning_to_qc[rows] = env.processes['scanning_to_qc'].out_duration
+
+    @staticmethod
+    def init_qc(env: 'Model', specimens: Sequence['InitSpecimen'],
+                arrays: BootstrapArrays) -> None:
+        """Generate task_durations for specimens that have already completed QC
         at simulation start."""
-        env: Model = self.env
-        env.specimen_data[self.name()]['bootstrap']['qc']\
-            = env.task_durations.block_and_quality_check()
+        arrays.qc[_rows(specimens)] = \
+            env.task_durations.block_and_quality_check(size=len(specimens))
         # Since scans are digital, no need for physical delivery to histopathologist
 
+    @staticmethod
+    def batch_bootstrap(specimens: Sequence['InitSpecimen'], env: 'Model') -> None:
+        """Generate task durations and mock timestamps for a list of mock specimens.
+
+        Each stage is processed for all specimens that have already completed that stage
+        (i.e. are inserted into the model at a later stage) at once, so that task durations
+        are sampled in bulk rather than one specimen at a time.
+        """
+        arrays = BootstrapArrays.zeros(len(specimens))
+        for idx, spec in enumerate(specimens):
+            spec.bootstrap_idx = idx
+
+        insert_idxs = np.array([spec.insert_idx for spec in specimens])
+        for stage_idx, (_, preprocess) in enumerate(_PREPROCESS):
+            group = [specimens[idx] for idx in np.flatnonzero(insert_idxs > stage_idx)]
+            if group:
+                preprocess(env, group, arrays)
+
+        InitSpecimen.compute_timestamps(specimens, env, arrays)
+
     def setup(self, **kwargs) -> None:
         super().setup(**kwargs)
-        env: Model = self.env
-
         self.insert_point = kwargs.get('insert_point', 'arrive_reception')
-        env.specimen_data[self.name()]['bootstrap']: dict[str, float] = {}
-        self.preprocess: dict[str, Callable[[Self], None]] = {
-            'reception': self.init_reception,
-            'cutup': self.init_cut_up,
-            'processing': self.init_processing,
-            'microtomy': self.init_microtomy,
-            'staining': self.init_staining,
-            'labelling': self.init_labelling,
-            'scanning': self.init_scanning,
-            'qc': self.init_qc
-        }
-
-    def compute_timestamps(self) -> None:
-        """Compute mock timestamps for the specimen. These are based on the assumption of no
-        delays and provide a minimum possible turnaround time for the mock specimen."""
-        env: Model = self.env
-        data = env.specimen_data[self.name()]
-
-        timestamp = 0
-        if 'qc' in data['bootstrap']:
-            data['qc_end'] = timestamp
-            timestamp -= data['bootstrap']['qc']
-            data['qc_start'] = timestamp
-        if 'scanning' in data['bootstrap']:
-            timestamp -= data['bootstrap']['scanning_to_qc']
-            data['scanning_end'] = timestamp
-            timestamp -= data['bootstrap']['scanning']
-            data['scanning_start'] = timestamp
-        if 'labelling' in data['bootstrap']:
-            timestamp -= data['bootstrap']['labelling_to_scanning']
-            data['labelling_end'] = timestamp
-            timestamp -= data['bootstrap']['labelling']
-            data['labelling_start'] = timestamp
-        if 'staining' in data['bootstrap']:
-            timestamp -= data['bootstrap']['staining_to_labelling']
-            data['staining_end'] = timestamp
-            timestamp -= data['bootstrap']['staining']
-            data['staining_start'] = timestamp
-        if 'microtomy' in data['bootstrap']:
-            timestamp -= data['bootstrap']['microtomy_to_staining']
-            data['microtomy_end'] = timestamp
-            timestamp -= data['bootstrap']['microtomy']
-            data['microtomy_start'] = timestamp
-        if 'processing' in data['bootstrap']:
-            timestamp -= data['bootstrap']['processing_to_microtomy']
-            data['processing_end'] = timestamp
-            timestamp -= data['bootstrap']['processing']
-            data['processing_start'] = timestamp
-        if 'cutup' in data['bootstrap']:
-            timestamp -= data['bootstrap']['cutup_to_processing']
-            data['cutup_end'] = timestamp
-            timestamp -= data['bootstrap']['cutup']
-            data['cutup_start'] = timestamp
-        if 'reception' in data['bootstrap']:
-            timestamp -= data['bootstrap']['reception_to_cutup']
-            data['reception_end'] = timestamp
-            timestamp -= data['bootstrap']['reception']
-            data['reception_start'] = timestamp
+        self.insert_idx = _INSERT_IDXS[self.insert_point]
+        self.bootstrap_idx: int | None = None
+        self.block_type: str | None = None  # Type of all blocks of this specimen, set at cut-up
+
+    @staticmethod
+    def compute_timestamps(specimens: Sequence['InitSpecimen'], env: 'Model',
+                           arrays: BootstrapArrays) -> None:
+        """Compute mock timestamps for the specimens. These are based on the assumption of no
+        delays and provide a minimum possible turnaround time for each mock specimen."""
+        if not specimens:
+            return
+
+        # Working backwards from time 0, subtract the transition to the next stage (giving
+        # the stage end time) and then the stage duration (giving the stage start time).
+        # Stages not yet completed by a specimen have zero duration.
+        deltas = np.column_stack([
+            getattr(arrays, key) if key is not None else np.zeros(len(specimens), dtype=np.float32)
+            for key in _TIMESTAMP_DELTA_KEYS
+        ])[_rows(specimens)]
+        timestamps = 0.0 - np.cumsum(deltas, axis=1)  # 0.0 - x avoids -0.0 for qc_end
+        # tolist() converts the float32 timestamps back to Python floats
+
+        n_stages = len(TIMESTAMP_SCHEDULE)
+        for spec, row in zip(specimens, timestamps.tolist()):
+            data = env.specimen_data[spec.name()]
+            # Only stages before the insert point have been completed
+            first = 2 * (n_stages - min(spec.insert_idx, n_stages))
+            data.update(zip(_TIMESTAMP_KEYS[first:], row[first:]))
         # else, specimen is waiting to start reception and will be assigned a 'reception_start'
         # timestamp of 0 when the simulation starts
 
     def process(self) -> None:
         """Overrides `super().process` as we will insert the specimen into the simulation model
         manually.  Does nothing."""
+
+
+_PREPROCESS = (
+    ('reception', InitSpecimen.init_reception),
+    ('cutup', InitSpecimen.init_cut_up),
+    ('processing', InitSpecimen.init_processing),
+    ('microtomy', InitSpecimen.init_microtomy),
+    ('staining', InitSpecimen.init_staining),
+    ('labelling', InitSpecimen.init_labelling),
+    ('scanning', InitSpecimen.init_scanning),
+    ('qc', InitSpecimen.init_qc)
+)
+"""Bootstrap functions for each stage in `STAGES` (except reporting), in order."""
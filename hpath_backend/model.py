@@ -5,16 +5,18 @@ is necessary for our backend as the Model class is
 not serialisable by the RQ (Redis job queue) module.
 """
 import dataclasses
+import random
 from dataclasses import dataclass
 from typing import Literal
 
 import dacite
+import numpy as np
 import salabim as sim
 
 from . import process
 from .config import Config, DistributionInfo, IntDistributionInfo, ResourceInfo
 from .distributions import PERT, Constant, Distribution, IntPERT, Tri
-from .mock_specimens import InitSpecimen
+from .mock_specimens import INSERT_POINTS, STAGES, InitSpecimen
 from .process import ArrivalGenerator, ProcessType, ResourceScheduler
 from .util import dc_items
 
@@ -186,6 +188,9 @@ class Model(sim.Environment):
     def setup(self, config: Config) -> None:  # pylint: disable=arguments-differ
         super().setup()
 
+        # NumPy random generator for bulk sampling, seeded from the salabim random seed
+        self.rng = np.random.default_rng(random.getrandbits(64))
+
         self.num_reps: int = config.num_reps
         self.sim_length: float = self.env.hours(config.sim_hours)
 
@@ -230,9 +235,11 @@ class Model(sim.Environment):
         for key, val in iter(config.task_durations_info):
             val: DistributionInfo
             task_durations[key] = (
-                PERT(val.low, val.mode, val.high, time_unit_full(val.time_unit), env=self)
+                PERT(val.low, val.mode, val.high, time_unit_full(val.time_unit), env=self,
+                     rng=self.rng)
                 if val.type == 'PERT' else
-                Tri(val.low, val.mode, val.high, time_unit_full(val.time_unit), env=self)
+                Tri(val.low, val.mode, val.high, time_unit_full(val.time_unit), env=self,
+                    rng=self.rng)
                 if val.type == 'Triangular' else
                 Constant(val.mode, time_unit_full(val.time_unit), env=self)
             )
@@ -241,13 +248,14 @@ class Model(sim.Environment):
         self.batch_sizes = config.batch_sizes
 
         # GLOBALS
-        self.globals = config.global_vars
+        self.globals = config.global_vars.model_copy()
         # Currently, only the IntPERT distribution is used in self.globals --
         # Convert these to distribution objects
         for key, val in iter(self.globals):
             if isinstance(val, IntDistributionInfo):
                 if val.type == 'IntPERT':
-                    setattr(self.globals, key, IntPERT(val.low, val.mode, val.high, env=self))
+                    setattr(self.globals, key, IntPERT(
+                        val.low, val.mode, val.high, env=self, rng=self.rng))
                 else:
                     raise ValueError(f'Distribution type {val.type} not (yet) supported.')
 
@@ -280,36 +288,18 @@ class Model(sim.Environment):
         self.u01 = sim.Uniform(0, 1, time_unit=None, env=self)
 
         # INITIAL SPECIMENS (MOCK)
-        stages = ['reception', 'cutup', 'processing', 'microtomy', 'staining',
-                  'labelling', 'scanning', 'qc', 'reporting']
-        insert_points = [
-            'arrive_reception',
-            'cutup_start',
-            'processing_start',
-            'microtomy',
-            'staining_start',
-            'labelling',
-            'scanning_start',
-            'qc',
-            'assign_histopath'
-        ]
-
         if config.opt_initial_specimens == 'mock':
             init_specimens: list[InitSpecimen] = []
-            for idx, stage in enumerate(stages):
-                insert_point = insert_points[idx]
+            for stage, insert_point in zip(STAGES, INSERT_POINTS):
                 for pathway in ['cancer', 'noncancer']:
                     mock_count = getattr(config.mock_counts, f'{stage}_{pathway}')
                     for _ in range(mock_count):
-                        specimen = InitSpecimen(env=self, cancer=pathway == 'cancer')
-
-                        # Generate timestamps
-                        for stage2 in stages[:idx]:
-                            specimen.preprocess[stage2]()
-                        specimen.compute_timestamps()
-                        self.specimen_data[specimen.name()]['insert_point'] = insert_point
+                        init_specimens.append(InitSpecimen(
+                            env=self, cancer=pathway == 'cancer', insert_point=insert_point
+                        ))
 
-                        init_specimens.append(specimen)
+            # Generate timestamps
+            InitSpecimen.batch_bootstrap(init_specimens, self)
 
             # Sort by time
             init_specimens.sort(key=lambda item: 
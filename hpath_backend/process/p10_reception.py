@@ -56,24 +56,26 @@ def booking_in(self: Specimen) -> None:
     env: Model = self.env
 
     self.request((env.resources.booking_in_staff, 1, self.prio))
+    is_internal = env.specimen_data[self.name()]['source'] == 'Internal'
 
     # Pre-booking-in investigation
     if env.u01() < env.globals.prob_prebook:
         self.hold(env.task_durations.pre_booking_in_investigation)
 
     # Booking-in
-    if env.specimen_data[self.name()]['source'] == 'Internal':
+    if is_internal:
         self.hold(env.task_durations.booking_in_internal)
     else:
         self.hold(env.task_durations.booking_in_external)
 
     # Additional investigation
-    if env.specimen_data[self.name()]['source'] == 'Internal':
+    if is_internal:
         r = env.u01()
+        prob_easy, prob_easy_or_hard = env.globals.invest_probs_internal
 
-        if r < env.globals.prob_invest_easy:
+        if r < prob_easy:
             self.hold(env.task_durations.booking_in_investigation_internal_easy)
-        elif r < env.globals.prob_invest_easy + env.globals.prob_invest_hard:
+        elif r < prob_easy_or_hard:
             self.hold(env.task_durations.booking_in_investigation_internal_hard)
 
     elif env.u01() < env.globals.prob_invest_external:
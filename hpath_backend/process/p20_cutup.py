@@ -87,11 +87,11 @@ def cutup_start(self: Specimen) -> None:
     env.specimen_data[self.name()]['cutup_start'] = env.now()
 
     r = env.u01()
-    suffix = '_urgent' if self.prio == Priority.URGENT else ''
-    if r < getattr(env.globals, 'prob_bms_cutup'+suffix):
+    probs = env.globals.cutup_probs_urgent if self.prio == Priority.URGENT \
+        else env.globals.cutup_probs
+    if r < probs[0]:
         cutup_type, next_process = 'BMS', 'cutup_bms'
-    elif r < (getattr(env.globals, 'prob_bms_cutup'+suffix) +
-              getattr(env.globals, 'prob_pool_cutup'+suffix)):
+    elif r < probs[1]:
         cutup_type, next_process = 'Pool', 'cutup_pool'
     else:
         cutup_type, next_process = 'Large specimens', 'cutup_large'
@@ -131,10 +131,11 @@ def processing_start(self: Specimen) -> None:
     env.specimen_data[self.name()]['processing_start'] = env.now()
 
     r = env.u01()
-    if r < env.globals.prob_decalc_bone:
+    prob_bone, prob_bone_or_oven = env.globals.decalc_probs
+    if r < prob_bone:
         env.specimen_data[self.name()]['decalc_type'] = 'bone station'
         out_queue = env.processes['batcher.decalc_bone_station'].in_queue
-    elif r < env.globals.prob_decalc_bone + env.globals.prob_decalc_oven:
+    elif r < prob_bone_or_oven:
         env.specimen_data[self.name()]['decalc_type'] = 'decalc oven'
         out_queue = env.processes['decalc_oven'].in_queue
     else:
@@ -1,23 +1,92 @@
 """Defines a redis worker for the histopathology simulator."""
+import functools
+import math
+import socket
+from typing import Any
+
+import msgpack
 import redis
 from rq import Queue, Worker
 
 from conf import REDIS_HOST, REDIS_PORT
 
 
-REDIS_CONN = redis.Redis(
-    host=REDIS_HOST,
-    port=REDIS_PORT
-)
-"""Provides an connection to the redis server at ``redis://<REDIS_HOST>:<REDIS_PORT>``."""
+DEFAULT_JOB_TIMEOUT = 3600
+"""Minimum time limit (in seconds) for a simulation job."""
+
+JOB_TIMEOUT_PER_SIM_HOUR = 5
+"""Additional time limit (in seconds) for a simulation job per simulated hour, so that long
+simulations are not killed by `DEFAULT_JOB_TIMEOUT`."""
+
+RESULT_TTL = 0
+"""Time (in seconds) to keep successful jobs in Redis.  Simulation jobs save their results to
+the database, so successful jobs are deleted immediately."""
+
+FAILURE_TTL = 86400
+"""Time (in seconds) to keep failed jobs in Redis, for debugging."""
+
+
+class MsgpackSerializer:
+    """RQ job serializer using msgpack instead of pickle.  Produces smaller job payloads
+    than pickle, with ``bytes`` stored natively as msgpack binary data.
+
+    Simulation jobs only take plain arguments (the scenario ID and simulation parameters),
+    as the worker loads the scenario configuration from the database."""
+
+    @staticmethod
+    def dumps(obj: Any) -> bytes:
+        """Serialize a job payload."""
+        return msgpack.packb(obj)
+
+    @staticmethod
+    def loads(data: bytes) -> Any:
+        """Deserialize a job payload."""
+        return msgpack.unpackb(data, strict_map_key=False)
+
+
+@functools.lru_cache(maxsize=1)
+def get_redis() -> redis.Redis:
+    """Return a connection to the redis server at ``redis://<REDIS_HOST>:<REDIS_PORT>``,
+    creating it on first use.
+
+    Connections are drawn from a pool shared by all threads; when all connections are in use,
+    callers wait for one to be released instead of failing.  Idle connections are kept alive
+    and health-checked before reuse.  (RQ workers raise ``socket_timeout`` to above their
+    dequeue timeout automatically.)
+    """
+    pool = redis.BlockingConnectionPool(
+        host=REDIS_HOST,
+        port=REDIS_PORT,
+        max_connections=32,
+        socket_timeout=5,
+        socket_keepalive=True,
+        socket_keepalive_options=(
+            {socket.TCP_KEEPIDLE: 60} if hasattr(socket, 'TCP_KEEPIDLE') else None
+        ),
+        health_check_interval=30
+    )
+    return redis.Redis(connection_pool=pool)
+
+
+@functools.lru_cache(maxsize=1)
+def get_queue() -> Queue:
+    """Return the redis queue for histopathology model simulation, creating it on first use."""
+    return Queue(
+        name='hpath',
+        connection=get_redis(),
+        default_timeout=DEFAULT_JOB_TIMEOUT,
+        serializer=MsgpackSerializer
+    )
+
 
-HPATH_SIM_QUEUE = Queue(name='hpath', connection=REDIS_CONN, default_timeout=3600)
-"""Redis queue for histopathology model simulation."""
+def job_timeout(sim_hours: float) -> int:
+    """Return the time limit (in seconds) for a simulation job of the given length."""
+    return max(DEFAULT_JOB_TIMEOUT, math.ceil(JOB_TIMEOUT_PER_SIM_HOUR * sim_hours))
 
 
 def start() -> None:
     """Start an RQ worker on the default queue."""
-    worker = Worker(queues=[HPATH_SIM_QUEUE], connection=REDIS_CONN)
+    worker = Worker(queues=[get_queue()], connection=get_redis(), serializer=MsgpackSerializer)
     worker.work(
         date_format="%d %b %Y %H:%M:%S",
         log_format="%(process)5d   %(asctime)s.%(msecs)03d %(message)s"
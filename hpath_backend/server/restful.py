@@ -36,23 +36,81 @@ REST API
 
 from base64 import b64decode
 from io import BytesIO
-import json
+from zipfile import BadZipFile, is_zipfile
 from http import HTTPStatus
 
+from typing import Any
+
 from flask import Flask, Response, request
+from flask.json.provider import JSONProvider
+from flask_compress import Compress
 from werkzeug.exceptions import HTTPException
 
-import pandas as pd
-import openpyxl as oxl
+import orjson
+import pydantic as pyd
+from rq import Queue
 
-from conf import PORT
-from hpath_backend.simulate import simulate
+from conf import DEBUG, MAX_CONTENT_LENGTH, PORT
+from hpath_backend.simulate import simulate_from_xlsx
 from .. import db
-from ..config import Config
 from ..types import HPathConfigParams, HPathSharedParams
-from .job_queue import HPATH_SIM_QUEUE
+from ..util import serialiser
+from .job_queue import FAILURE_TTL, RESULT_TTL, get_queue, job_timeout
+
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider using :py:mod:`orjson` instead of the standard library
+    :py:mod:`json` module.  Used for all request and response bodies."""
+
+    option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    """Options passed to :py:func:`orjson.dumps`."""
+
+    def dumps(self, obj: Any, **kwargs) -> str:
+        return orjson.dumps(obj, default=serialiser, option=self.option).decode()
+
+    def loads(self, s: str | bytes, **kwargs) -> Any:
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=serialiser, option=self.option),
+            mimetype='application/json'
+        )
+
+
+SHARED_PARAMS_ADAPTER = pyd.TypeAdapter(HPathSharedParams)
+"""Validates the shared parameters of a submitted analysis, converting values to the field
+types of :py:class:`~hpath_backend.types.HPathSharedParams`."""
+
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
+app.config['MAX_CONTENT_LENGTH'] = MAX_CONTENT_LENGTH
+
+# Compress responses (mostly JSON) when the client accepts it.  Brotli and gzip
+# levels of 4 trade a little compression ratio for much faster compression.
+app.config.update(
+    COMPRESS_ALGORITHM=['br', 'gzip'],
+    COMPRESS_BR_LEVEL=4,
+    COMPRESS_LEVEL=4,
+    COMPRESS_MIN_SIZE=1024
+)
+Compress(app)
+
+
+def _json(obj: Any, status: int = HTTPStatus.OK) -> Response:
+    """Return a JSON response, serialized using :py:mod:`orjson`."""
+    return Response(
+        orjson.dumps(obj, default=serialiser, option=OrjsonProvider.option),
+        status=status,
+        mimetype='application/json'
+    )
+
+
+def _json_error(exc: Exception, status: int) -> Response:
+    """Return a JSON response describing an exception."""
+    return _json({'type': str(type(exc)), 'msg': str(exc)}, status)
 
 
 @app.errorhandler(HTTPException)
@@ -61,11 +119,11 @@ def handle_exception(exc: HTTPException):
     # start with the correct headers and status code from the error
     response = exc.get_response()
     # replace the body with JSON
-    response.data = json.dumps({
+    response.data = orjson.dumps({
         "code": exc.code,
         "name": exc.name,
         "description": exc.description,
-    }, separators=(',', ':'))
+    })
     response.content_type = "application/json"
     return response
 
@@ -101,32 +159,45 @@ def clear() -> Response:
         db.clear()
         return Response(status=HTTPStatus.OK)
     except Exception as exc:  # Database error
-        return {'type': str(type(exc)), 'msg': str(exc)}, HTTPStatus.INTERNAL_SERVER_ERROR
+        return _json_error(exc, HTTPStatus.INTERNAL_SERVER_ERROR)
 
 
 @app.route('/submit/', methods=['POST'])
 def new_scenario() -> Response:
     """Process POST request for creating a new scenario or multi-scenario analysis."""
-    sc_data: dict = request.json['scenarios']
-    params_dict: dict = request.json['params']
+    # Parse the (possibly very large) body directly with orjson, without caching the raw
+    # bytes on the request
+    data = request.get_data(cache=False)
 
     try:
-        params = HPathSharedParams(**params_dict)
-        configs = parse_sc_data(sc_data, params)
+        body = orjson.loads(data)
+        del data
+        sc_data: list[dict] | dict = body['scenarios']
+        params_dict: dict = body['params']
+        params = SHARED_PARAMS_ADAPTER.validate_python(params_dict)
+        configs = parse_sc_data(sc_data)
     except Exception as exc:  # Parse error
-        return {'type': str(type(exc)), 'msg': str(exc)}, HTTPStatus.BAD_REQUEST
-
-    try:
-        scenario_ids = db.submit_scenarios(configs, params)
-    except Exception as exc:  # Database error
-        return {'type': str(type(exc)), 'msg': str(exc)}, HTTPStatus.INTERNAL_SERVER_ERROR
+        return _json_error(exc, HTTPStatus.BAD_REQUEST)
+
+    def enqueue(scenario_ids: list[int]) -> None:
+        """Submit all jobs to Redis in a single pipeline."""
+        get_queue().enqueue_many([
+            Queue.prepare_data(
+                simulate_from_xlsx,
+                args=(scenario_id, params.sim_hours, params.num_reps),
+                timeout=job_timeout(params.sim_hours),
+                result_ttl=RESULT_TTL,
+                failure_ttl=FAILURE_TTL,
+                meta={'scenario_id': scenario_id}
+            )
+            for scenario_id in scenario_ids
+        ])
 
     try:
-        for config, scenario_id in zip(configs, scenario_ids):
-            config_obj = Config(**json.loads(config.config))
-            HPATH_SIM_QUEUE.enqueue(simulate, config_obj, scenario_id)
-    except Exception as exc:  # Redis error
-        return {'type': str(type(exc)), 'msg': str(exc)}, HTTPStatus.INTERNAL_SERVER_ERROR
+        # Jobs are enqueued once the scenarios have been committed to the database
+        db.submit_scenarios(configs, params, on_submit=enqueue)
+    except Exception as exc:  # Database or Redis error
+        return _json_error(exc, HTTPStatus.INTERNAL_SERVER_ERROR)
 
     return Response(status=HTTPStatus.OK)
 
@@ -134,8 +205,7 @@ def new_scenario() -> Response:
 @app.route('/scenarios/')
 def list_scenarios() -> Response:
     """Return a dict of scenarios on the server. Used to populate a Dash AG Grid."""
-    scenarios = db.list_scenarios()
-    return scenarios.to_dict('records')
+    return _json(db.list_scenarios())
 
 
 @app.route('/scenarios/<scenario_id>/results/')
@@ -150,17 +220,17 @@ def results_scenario(scenario_id: int) -> Response:
     try:
         s_id = int(scenario_id)
     except ValueError as exc:
-        return {'type': str(type(exc)), 'msg': str(exc)}, HTTPStatus.NOT_FOUND
+        return _json_error(exc, HTTPStatus.NOT_FOUND)
 
     # Fetch the scenario results
     try:
         res = db.results_scenario(s_id)
-        if res.empty:
+        if not res:
             raise RowNotFoundError(not_found_text)
-    except AssertionError as exc:
-        return {'type': str(type(exc)), 'msg': str(exc)}, HTTPStatus.NOT_FOUND
+    except RowNotFoundError as exc:
+        return _json_error(exc, HTTPStatus.NOT_FOUND)
 
-    return res.to_dict('records')
+    return _json(res)
 
 
 # TODO remaining endpoints
@@ -189,68 +259,62 @@ class ExcelException(Exception):
     """Raised when openpyxl raises an error."""
 
 
-class ParseConfigError(Exception):
-    """Raised when parsing an openpyxl Workbook as a Config raises an error."""
+def parse_sc_data(sc_data: list[dict] | dict) -> list[HPathConfigParams]:
+    """Decode and check scenario data from REST request."""
 
+    # DECODE AND CHECK EACH SCENARIO
+    configs = [_parse_sc(idx, sc) for idx, sc in enumerate(_sc_records(sc_data))]
 
-def parse_sc_data(sc_data: dict, params: HPathSharedParams) -> list[HPathConfigParams]:
-    """Parse and validate scenario data from REST request."""
+    app.logger.info('')
+    app.logger.info('')
 
-    sc_df = pd.DataFrame(sc_data)
-    configs: list[HPathConfigParams] = []
+    return configs
 
-    # LOAD AND PARSE EACH SCENARIO
-    for sc in sc_df.itertuples():
-        app.logger.info("%s. %s %s %s", sc.Index, sc.sc_name, sc.file_name, sc.decode_len_str)
-        sc_bytes = b64decode(sc.file_base64.split('base64,')[1])
 
-        # Try to load the xlsx file in openpyxl
-        try:
-            # data_only: Replace formulas with computed values
-            wbook = oxl.load_workbook(BytesIO(sc_bytes), data_only=True)
-        except Exception as exc:
-            app.logger.error(
-                'Error when reading "%s" (scenario "%s"): %s',
-                sc.file_name, sc.sc_name, str(exc)
-            )
-            raise ExcelException(
-                f"""\
-Error when reading {sc.file_name} (scenario {sc.sc_name}). \
+def _sc_records(sc_data: list[dict] | dict) -> list[dict]:
+    """Convert scenario data from REST request to a list of dicts, one per scenario.  Scenario
+    data may be given as a list of records or as a dict of columns, where each column is a
+    list or an index-to-value dict."""
+    if not isinstance(sc_data, dict):
+        return list(sc_data)
+    columns = {
+        key: list(col.values()) if isinstance(col, dict) else list(col)
+        for key, col in sc_data.items()
+    }
+    return [dict(zip(columns, row)) for row in zip(*columns.values())]
+
+
+def _parse_sc(idx: int, sc: dict) -> HPathConfigParams:
+    """Decode and check a single scenario from REST request.  Only the container format of
+    the file is checked here; the file is parsed as a :py:class:`~hpath_backend.config.Config`
+    by the simulation job."""
+    sc_name, file_name = sc['sc_name'], sc['file_name']
+    app.logger.info("%s. %s %s %s", idx, sc_name, file_name, sc['decode_len_str'])
+    # Strip the data URI prefix without copying the payload into a list of parts
+    _, _, file_base64 = sc['file_base64'].partition('base64,')
+
+    # Check that the file is a valid xlsx (zip) container
+    try:
+        sc_bytes = b64decode(file_base64)
+        if not is_zipfile(BytesIO(sc_bytes)):
+            raise BadZipFile('File is not a zip file')
+    except Exception as exc:
+        app.logger.error(
+            'Error when reading "%s" (scenario "%s"): %s',
+            file_name, sc_name, str(exc)
+        )
+        raise ExcelException(
+            f"""\
+Error when reading {file_name} (scenario {sc_name}). \
 Is the file a valid Excel file?
 
-openpyxl error message:
-    {str(exc)}
-"""
-            ) from exc
-
-        # Validate the config
-        try:
-            config = Config.from_workbook(wbook, params.sim_hours, params.num_reps)
-            config_data = HPathConfigParams(
-                name=sc.sc_name,
-                file_name=sc.file_name,
-                config=config.model_dump_json(),
-                file=sc_bytes
-            )
-            configs.append(config_data)
-        except Exception as exc:
-            app.logger.error(
-                '    Error (type %s) when parsing "%s" (scenario "%s"): %s',
-                type(exc), sc.file_name, sc.sc_name, str(exc)
-            )
-            raise ParseConfigError(
-                f"""\
-Error (type {type(exc)}) when parsing “{sc.file_name}” (scenario: “{sc.sc_name}”): \
+Error message:
     {str(exc)}
 """
-            ) from exc
-
-        app.logger.info('OK!')
+        ) from exc
 
-    app.logger.info('')
-    app.logger.info('')
-
-    return configs
+    app.logger.info('OK!')
+    return HPathConfigParams(name=sc_name, file_name=file_name, file=sc_bytes)
 
 ##########################################
 ##                                      ##
@@ -267,4 +331,4 @@ Error (type {type(exc)}) when parsing “{sc.file_name}” (scenario: “{sc.sc_
 
 if __name__ == '__main__':
     db.init()
-    app.run(host='0.0.0.0', port=PORT, debug=True)
+    app.run(host='0.0.0.0', port=PORT, debug=DEBUG)
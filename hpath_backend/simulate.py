@@ -1,5 +1,11 @@
 """Module containing the main simulation entry point for histopathology model
 configurations."""
+import hashlib
+from io import BytesIO
+
+import openpyxl as oxl
+import pydantic_core
+
 from .config import Config
 from .kpis import Report
 from .model import Model
@@ -11,6 +17,50 @@ def simulate(config: Config, scenario_id: int):
     print(f"SIM: id={scenario_id}, sim_hours={config.sim_hours}")
     model = Model(config)
     model.run()
-    report_json = Report.from_model(model).model_dump_json()
-    db.update_progress(scenario_id)
-    db.save_result(scenario_id, report_json)
+    report_json = pydantic_core.to_json(Report.from_model(model))
+    db.save_result(scenario_id, report_json, increment_progress=True)
+
+
+def load_config(scenario_id: int, sim_hours: float, num_reps: int) -> Config:
+    """Load the config for a scenario from the config file submitted for it.
+
+    Parsed configs are cached in the database, keyed on a hash of the config file, so that
+    re-submitting the same file (e.g. when only varying ``sim_hours`` or ``num_reps``) skips
+    parsing the Excel workbook.
+    """
+    file = db.load_file(scenario_id)
+    file_hash = hashlib.blake2b(file, digest_size=16).digest()
+
+    config_json = db.load_config(file_hash)
+    if config_json is not None:
+        return Config.model_validate_json(config_json).model_copy(
+            update={'sim_hours': sim_hours, 'num_reps': num_reps}
+        )
+
+    # data_only: Replace formulas with computed values
+    # keep_links: Skip loading cached data from external workbook links
+    # NOTE: read_only mode is not used as Config.from_workbook reads named tables,
+    # which openpyxl does not load for read-only worksheets
+    wbook = oxl.load_workbook(BytesIO(file), data_only=True, keep_links=False)
+    try:
+        config = Config.from_workbook(wbook, sim_hours, num_reps)
+    finally:
+        wbook.close()
+    db.save_config(file_hash, config.model_dump_json())
+    return config
+
+
+def simulate_from_xlsx(scenario_id: int, sim_hours: float, num_reps: int):
+    """Load the config for a scenario, then run a simulation and update the hpath simulation
+    database.  If the config cannot be loaded, the error is saved to the database (and
+    re-raised, so that the job is marked as failed)."""
+    try:
+        config = load_config(scenario_id, sim_hours, num_reps)
+    except Exception as exc:
+        db.save_error(
+            scenario_id,
+            f"Error (type {type(exc)}) when parsing the config file for scenario "
+            f"{scenario_id}: {str(exc)}"
+        )
+        raise exc
+    simulate(config, scenario_id)
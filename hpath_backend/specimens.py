@@ -29,6 +29,17 @@ class Component(sim.Component, ABC):
     parent: Self | None
     data: dict[str, Any]
 
+    @classmethod
+    def bulk_create(cls, n: int, *, env: 'Model', parent: 'Component', **kwargs) -> list[Self]:
+        """Create `n` components of this type with the same parent and properties.
+
+        The components are named after the parent with a serial number suffix, as for
+        components created individually using ``cls(f'{parent.name()}.', ...)``. Each component
+        receives its own copy of `kwargs` as its ``data`` dict.
+        """
+        name = f'{parent.name()}.'
+        return [cls(name, env=env, parent=parent, **kwargs) for _ in range(n)]
+
 
 C = TypeVar('C', bound=Component)
 
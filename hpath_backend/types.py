@@ -10,6 +10,6 @@ HPathSharedParams = NamedTuple(
 
 HPathConfigParams = NamedTuple(
     'HPathConfigParams',
-    [('name', str), ('file_name', str), ('config', str), ('file', bytes)]
+    [('name', str), ('file_name', str), ('file', bytes)]
 )
 """Parameters for a single submiited scenario."""